@@ -38,6 +38,8 @@ const envSchema = z
   // Tinkoff InvestAPI
   TINKOFF_TOKEN: z.preprocess((v) => (v === '' ? undefined : v), z.string().min(1).optional()),
   TINKOFF_DEMO_TOKEN: z.preprocess((v) => (v === '' ? undefined : v), z.string().min(1).optional()),
+  // Сколько свободных keep-alive соединений к Tinkoff API держать тёплыми между запросами (не лимит параллельности)
+  TINKOFF_POOL_SIZE: z.coerce.number().int().positive().max(32).default(4),
 
   // Serper — поиск в интернете для актуальных данных в AI-чате (курсы, даты, факты)
   SERPER_API_KEY: z.preprocess((v) => (v === '' ? undefined : v), z.string().min(1).optional()),
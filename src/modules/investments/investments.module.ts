@@ -1,4 +1,5 @@
 import { Module } from '@nestjs/common';
+import { HttpAdapterHost } from '@nestjs/core';
 import { InvestmentsService } from './investments.service';
 import { InvestmentsController } from './investments.controller';
 import { CoinGeckoCryptoMarketService } from './services/coingecko-crypto-market.service';
@@ -24,16 +25,21 @@ import { TinkoffMarketDataProvider } from './providers/tinkoff-market-data.provi
         tinkoff: TinkoffMarketDataProvider,
         moex: MoexMarketDataProvider,
         mockProvider: MockMarketDataProvider,
+        httpAdapterHost: HttpAdapterHost,
       ) => {
         // Prefer Tinkoff if token is configured, otherwise fallback to MOEX, then mock
         const tinkoffToken = (env.TINKOFF_DEMO_TOKEN ?? env.TINKOFF_TOKEN)?.trim();
         if (tinkoffToken) {
+          // Справочник греем только в HTTP-приложении: у разовых скриптов (createApplicationContext) httpAdapter нет
+          if (httpAdapterHost.httpAdapter) {
+            tinkoff.warmUpCatalog();
+          }
           return new CachedMarketDataProvider(tinkoff);
         }
         // Fallback to MOEX for RF tickers; fallback to mock if MOEX is down.
         return new CachedMarketDataProvider(moex);
       },
-      inject: [TinkoffMarketDataProvider, MoexMarketDataProvider, MockMarketDataProvider],
+      inject: [TinkoffMarketDataProvider, MoexMarketDataProvider, MockMarketDataProvider, HttpAdapterHost],
     },
   ],
   exports: [InvestmentsService],
@@ -679,24 +679,42 @@ export class InvestmentsService {
       throw new NotFoundException(`Price not available for ${ticker}`);
     }
 
-    let name = ticker;
-    let currency = 'RUB';
-    let exchange: string | null = null;
-    try {
-      const searchResults = await this.marketDataProvider.searchAssets(ticker, 'STOCK');
-      const assetInfo = searchResults.find((a) => a.symbol.toUpperCase() === ticker.toUpperCase());
-      if (assetInfo) {
-        name = assetInfo.name || ticker;
-        currency = assetInfo.currency || 'RUB';
-        exchange = assetInfo.exchange || null;
-      }
-    } catch {
-      // ignore
-    }
+    // Название/валюта и дневное изменение не зависят друг от друга — запрашиваем параллельно
+    const [assetInfo, prevClose] = await Promise.all([
+      this.marketDataProvider
+        .searchAssets(ticker, 'STOCK')
+        .then((results) => results.find((a) => a.symbol.toUpperCase() === ticker.toUpperCase()))
+        .catch(() => undefined),
+      this.getPreviousClose(ticker),
+    ]);
+
+    const name = assetInfo?.name || ticker;
+    const currency = assetInfo?.currency || 'RUB';
+    const exchange = assetInfo?.exchange || null;
 
     // Дневное изменение: цена закрытия предыдущего торгового дня (как в Тинькофф)
     let change = 0;
     let changePercent = 0;
+    if (prevClose != null && prevClose > 0) {
+      change = price - prevClose;
+      changePercent = (change / prevClose) * 100;
+    }
+
+    return {
+      ticker: ticker.toUpperCase(),
+      name,
+      price,
+      change,
+      changePercent,
+      currency,
+      exchange,
+      logo: getAssetLogoUrl(ticker),
+      timestamp: new Date().toISOString(),
+    };
+  }
+
+  /** Цена закрытия предыдущего торгового дня по свечам провайдера (null, если свечи недоступны). */
+  private async getPreviousClose(ticker: string): Promise<number | null> {
     try {
       const provider = this.marketDataProvider as any;
       if (provider.getInstrumentByTicker && provider.getCandles) {
@@ -712,28 +730,14 @@ export class InvestmentsService {
               candles.length >= 2
                 ? (candles[candles.length - 2] as { close?: number })?.close
                 : (candles[candles.length - 1] as { close?: number })?.close;
-            if (prevClose != null && prevClose > 0) {
-              change = price - prevClose;
-              changePercent = (change / prevClose) * 100;
-            }
+            return prevClose ?? null;
           }
         }
       }
     } catch (err) {
       this.logger.debug(`Could not get daily change for ${ticker}: ${(err as Error)?.message}`);
     }
-
-    return {
-      ticker: ticker.toUpperCase(),
-      name,
-      price,
-      change,
-      changePercent,
-      currency,
-      exchange,
-      logo: getAssetLogoUrl(ticker),
-      timestamp: new Date().toISOString(),
-    };
+    return null;
   }
 
   /**
@@ -761,7 +765,6 @@ export class InvestmentsService {
         tickers = popularTickers;
     }
 
-    const results = [];
     const pricesMap = await this.marketDataProvider.getCurrentPricesBatch(
       tickers.map((t) => ({ symbol: t, exchange: 'MOEX' })),
     );
@@ -771,56 +774,60 @@ export class InvestmentsService {
     yesterday.setDate(yesterday.getDate() - 1);
     const today = new Date();
 
-    for (const ticker of tickers) {
-      const currentPrice = pricesMap.get(ticker.toUpperCase());
-      if (currentPrice === undefined || currentPrice === null) continue;
-
-      // Search for asset info
-      const searchResults = await this.marketDataProvider.searchAssets(ticker, 'STOCK');
-      const assetInfo = searchResults.find((a) => a.symbol.toUpperCase() === ticker.toUpperCase());
-
-      if (!assetInfo) continue;
-
-      // Try to get yesterday's price from candles
-      let prevPrice = currentPrice * 0.98; // Fallback
-      try {
-        const tinkoffProvider = this.marketDataProvider as any;
-        if (tinkoffProvider.getInstrumentByTicker && tinkoffProvider.getCandles) {
-          const instrument = await tinkoffProvider.getInstrumentByTicker(ticker);
-          if (instrument) {
-            const candles = await tinkoffProvider.getCandles(
-              instrument.figi,
-              yesterday,
-              today,
-              'DAY',
-            );
-            if (candles && candles.length > 0) {
-              const lastCandle = candles[candles.length - 1];
-              if (lastCandle && lastCandle.close) {
-                prevPrice = lastCandle.close;
+    // Тикеры обрабатываются параллельно: поиск и свечи по каждому не ждут предыдущий тикер
+    const rows = await Promise.all(
+      tickers.map(async (ticker) => {
+        const currentPrice = pricesMap.get(ticker.toUpperCase());
+        if (currentPrice === undefined || currentPrice === null) return null;
+
+        // Search for asset info
+        const searchResults = await this.marketDataProvider.searchAssets(ticker, 'STOCK');
+        const assetInfo = searchResults.find((a) => a.symbol.toUpperCase() === ticker.toUpperCase());
+
+        if (!assetInfo) return null;
+
+        // Try to get yesterday's price from candles
+        let prevPrice = currentPrice * 0.98; // Fallback
+        try {
+          const tinkoffProvider = this.marketDataProvider as any;
+          if (tinkoffProvider.getInstrumentByTicker && tinkoffProvider.getCandles) {
+            const instrument = await tinkoffProvider.getInstrumentByTicker(ticker);
+            if (instrument) {
+              const candles = await tinkoffProvider.getCandles(
+                instrument.figi,
+                yesterday,
+                today,
+                'DAY',
+              );
+              if (candles && candles.length > 0) {
+                const lastCandle = candles[candles.length - 1];
+                if (lastCandle && lastCandle.close) {
+                  prevPrice = lastCandle.close;
+                }
               }
             }
           }
+        } catch (error) {
+          this.logger.debug(`Could not get historical price for ${ticker}, using fallback`);
         }
-      } catch (error) {
-        this.logger.debug(`Could not get historical price for ${ticker}, using fallback`);
-      }
-
-      const change = currentPrice - prevPrice;
-      const changePercent = prevPrice > 0 ? (change / prevPrice) * 100 : 0;
 
-      results.push({
-        ticker: assetInfo.symbol,
-        name: assetInfo.name,
-        price: currentPrice,
-        change,
-        changePercent,
-        currency: assetInfo.currency,
-        exchange: assetInfo.exchange,
-        type: assetInfo.type,
-        logo: getAssetLogoUrl(assetInfo.symbol),
-      });
-    }
+        const change = currentPrice - prevPrice;
+        const changePercent = prevPrice > 0 ? (change / prevPrice) * 100 : 0;
+
+        return {
+          ticker: assetInfo.symbol,
+          name: assetInfo.name,
+          price: currentPrice,
+          change,
+          changePercent,
+          currency: assetInfo.currency,
+          exchange: assetInfo.exchange,
+          type: assetInfo.type,
+          logo: getAssetLogoUrl(assetInfo.symbol),
+        };
+      }),
+    );
+    const results = rows.filter((r): r is NonNullable<typeof r> => r !== null);
 
     // Sort by change percent based on category
     if (category === 'falling') {
@@ -0,0 +1,81 @@
+import { CachedMarketDataProvider } from './cached-market-data.provider';
+
+const mockRedis: any = {
+  get: jest.fn(),
+  setex: jest.fn(),
+  mget: jest.fn(),
+  pipeline: jest.fn(),
+  quit: jest.fn(),
+};
+
+jest.mock('ioredis', () => jest.fn().mockImplementation(() => mockRedis));
+jest.mock('../../../config/env.validation', () => ({
+  env: { REDIS_URL: 'redis://localhost:6379' },
+}));
+
+describe('CachedMarketDataProvider', () => {
+  let cached: CachedMarketDataProvider;
+
+  const mockProvider: any = {
+    getCurrentPrice: jest.fn(),
+    getCurrentPricesBatch: jest.fn(),
+    searchAssets: jest.fn(),
+  };
+
+  beforeEach(() => {
+    mockRedis.get.mockResolvedValue(null);
+    mockRedis.setex.mockResolvedValue('OK');
+    cached = new CachedMarketDataProvider(mockProvider);
+  });
+
+  afterEach(() => {
+    jest.clearAllMocks();
+  });
+
+  describe('getCurrentPrice', () => {
+    it('should make one provider call for concurrent cache misses of the same ticker', async () => {
+      let resolvePrice!: (price: number) => void;
+      mockProvider.getCurrentPrice.mockReturnValue(
+        new Promise<number>((resolve) => {
+          resolvePrice = resolve;
+        }),
+      );
+
+      const first = cached.getCurrentPrice('SBER');
+      const second = cached.getCurrentPrice('sber');
+      // Дать обоим вызовам пройти промах Redis до ответа провайдера
+      await new Promise((resolve) => setImmediate(resolve));
+      resolvePrice(250.5);
+
+      await expect(Promise.all([first, second])).resolves.toEqual([250.5, 250.5]);
+      expect(mockProvider.getCurrentPrice).toHaveBeenCalledTimes(1);
+      expect(mockRedis.setex).toHaveBeenCalledWith('market:price:SBER', 600, '250.5');
+    });
+
+    it('should clear the in-flight entry after the provider call settles', async () => {
+      mockProvider.getCurrentPrice.mockResolvedValueOnce(100).mockResolvedValueOnce(101);
+
+      await expect(cached.getCurrentPrice('GAZP')).resolves.toBe(100);
+      expect((cached as any).inFlight.size).toBe(0);
+
+      await expect(cached.getCurrentPrice('GAZP')).resolves.toBe(101);
+      expect(mockProvider.getCurrentPrice).toHaveBeenCalledTimes(2);
+    });
+
+    it('should clear the in-flight entry when the provider call fails', async () => {
+      mockProvider.getCurrentPrice.mockRejectedValueOnce(new Error('network')).mockResolvedValueOnce(42);
+
+      await expect(cached.getCurrentPrice('LKOH')).rejects.toThrow('network');
+      expect((cached as any).inFlight.size).toBe(0);
+
+      await expect(cached.getCurrentPrice('LKOH')).resolves.toBe(42);
+    });
+
+    it('should return cached price without calling provider', async () => {
+      mockRedis.get.mockResolvedValue('175.5');
+
+      await expect(cached.getCurrentPrice('SBER')).resolves.toBe(175.5);
+      expect(mockProvider.getCurrentPrice).not.toHaveBeenCalled();
+    });
+  });
+});
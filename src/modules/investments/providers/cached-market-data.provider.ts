@@ -12,6 +12,8 @@ export class CachedMarketDataProvider implements MarketDataProvider {
   private readonly logger = new Logger(CachedMarketDataProvider.name);
   private readonly redis: Redis;
   private readonly cacheTtlSeconds = 10 * 60; // 10 minutes default
+  /** Запросы цены к провайдеру, которые ещё выполняются: одновременные промахи кеша по одному тикеру ждут один запрос. */
+  private readonly inFlight = new Map<string, Promise<number | null>>();
 
   constructor(private readonly provider: MarketDataProvider) {
     this.redis = new Redis(env.REDIS_URL);
@@ -33,6 +35,19 @@ export class CachedMarketDataProvider implements MarketDataProvider {
       this.logger.warn(`Cache read error for ${symbol}: ${error instanceof Error ? error.message : String(error)}`);
     }
 
+    const pending = this.inFlight.get(cacheKey);
+    if (pending) {
+      return pending;
+    }
+
+    const request = this.fetchAndCache(symbol, exchange, cacheKey).finally(() => {
+      this.inFlight.delete(cacheKey);
+    });
+    this.inFlight.set(cacheKey, request);
+    return request;
+  }
+
+  private async fetchAndCache(symbol: string, exchange: string | null | undefined, cacheKey: string): Promise<number | null> {
     // Fetch from provider
     const price = await this.provider.getCurrentPrice(symbol, exchange);
 
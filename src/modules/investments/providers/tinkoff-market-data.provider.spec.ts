@@ -0,0 +1,243 @@
+import { EventEmitter } from 'node:events';
+import { request } from 'node:https';
+import { TinkoffMarketDataProvider } from './tinkoff-market-data.provider';
+
+jest.mock('node:https', () => ({ ...jest.requireActual('node:https'), request: jest.fn() }));
+
+jest.mock('../../../config/env.validation', () => ({
+  env: { TINKOFF_TOKEN: 't.test-token', TINKOFF_POOL_SIZE: 2 },
+}));
+
+describe('TinkoffMarketDataProvider', () => {
+  let provider: TinkoffMarketDataProvider;
+  let callApi: jest.SpyInstance;
+
+  const ok = (data: unknown) => ({ ok: true, status: 200, statusText: 'OK', data });
+  const failed = (status: number) => ({ ok: false, status, statusText: 'Error', data: null });
+
+  const findInstrumentCalls = (query: string) =>
+    callApi.mock.calls.filter(([method, body]) => method === 'InstrumentsService/FindInstrument' && body.query === query)
+      .length;
+
+  beforeEach(() => {
+    provider = new TinkoffMarketDataProvider();
+    // Справочник в этих тестах не грузим: резолв идёт через FindInstrument
+    (provider as any).catalogRefreshAt = Number.POSITIVE_INFINITY;
+    callApi = jest.spyOn(provider as any, 'callApi');
+  });
+
+  afterEach(() => {
+    provider.onModuleDestroy();
+    jest.clearAllMocks();
+  });
+
+  describe('getCurrentPricesBatch', () => {
+    it('should give the price to every symbol sharing a FIGI with one GetLastPrices call', async () => {
+      callApi.mockImplementation(async (method: string, body: any) => {
+        if (method === 'InstrumentsService/FindInstrument') {
+          return ok({
+            instruments: [
+              { ticker: 'AAA', figi: 'FIGI1', name: 'Share A', instrumentKind: 'INSTRUMENT_TYPE_SHARE' },
+              { ticker: 'BBB', figi: 'FIGI1', name: 'Share A (alias)', instrumentKind: 'INSTRUMENT_TYPE_SHARE' },
+            ].filter((inst) => inst.ticker === String(body.query).toUpperCase()),
+          });
+        }
+        if (method === 'MarketDataService/GetLastPrices') {
+          return ok({ lastPrices: [{ figi: 'FIGI1', price: { units: '100', nano: 500_000_000 } }] });
+        }
+        throw new Error(`unexpected method ${method}`);
+      });
+
+      const result = await provider.getCurrentPricesBatch([{ symbol: 'aaa' }, { symbol: 'BBB' }]);
+
+      expect(result.get('AAA')).toBe(100.5);
+      expect(result.get('BBB')).toBe(100.5);
+      const priceCalls = callApi.mock.calls.filter(([method]) => method === 'MarketDataService/GetLastPrices');
+      expect(priceCalls).toHaveLength(1);
+      expect(priceCalls[0]?.[1]).toEqual({ figi: ['FIGI1'] });
+    });
+
+    it('should negatively cache a ticker only after a successful no-match answer', async () => {
+      callApi.mockImplementation(async (method: string, body: any) => {
+        if (method === 'InstrumentsService/FindInstrument') {
+          return body.query === 'FAIL' ? failed(500) : ok({ instruments: [] });
+        }
+        throw new Error(`unexpected method ${method}`);
+      });
+
+      await provider.getCurrentPricesBatch([{ symbol: 'NOPE' }, { symbol: 'FAIL' }]);
+      const result = await provider.getCurrentPricesBatch([{ symbol: 'NOPE' }, { symbol: 'FAIL' }]);
+
+      expect(result.size).toBe(0);
+      expect(findInstrumentCalls('NOPE')).toBe(1);
+      expect(findInstrumentCalls('FAIL')).toBe(2);
+      expect(callApi).not.toHaveBeenCalledWith('MarketDataService/GetLastPrices', expect.anything());
+    });
+
+    it('should not negatively cache a ticker when the request throws', async () => {
+      callApi.mockRejectedValueOnce(new Error('socket hang up')).mockResolvedValueOnce(ok({ instruments: [] }));
+
+      await provider.getCurrentPricesBatch([{ symbol: 'SBER' }]);
+      await provider.getCurrentPricesBatch([{ symbol: 'SBER' }]);
+
+      expect(findInstrumentCalls('SBER')).toBe(2);
+    });
+  });
+
+  describe('instruments catalog', () => {
+    const CATALOG_RETRY_MS = 5 * 60 * 1000;
+
+    const loadCatalog = async () => {
+      (provider as any).catalogRefreshAt = 0;
+      provider.warmUpCatalog();
+      await (provider as any).catalogLoading;
+    };
+
+    const stubCatalog = (sources: Record<string, unknown>) => {
+      callApi.mockImplementation(async (method: string, body: any) => {
+        if (method in sources) {
+          const source = sources[method];
+          return typeof source === 'number' ? failed(source) : ok({ instruments: source });
+        }
+        if (method === 'InstrumentsService/FindInstrument') {
+          return ok({
+            instruments: [{ ticker: body.query, figi: `FIND-${body.query}`, name: body.query, instrumentKind: 'INSTRUMENT_TYPE_SHARE' }],
+          });
+        }
+        throw new Error(`unexpected method ${method}`);
+      });
+    };
+
+    it('should prefer a share over an ETF or bond with the same ticker', async () => {
+      stubCatalog({
+        'InstrumentsService/Shares': [{ ticker: 'DUP', figi: 'SHARE1', name: 'Share', currency: 'rub', apiTradeAvailableFlag: false }],
+        'InstrumentsService/Etfs': [{ ticker: 'DUP', figi: 'ETF1', name: 'Fund', currency: 'rub', apiTradeAvailableFlag: true }],
+        'InstrumentsService/Bonds': [{ ticker: 'DUP', figi: 'BOND1', name: 'Bond', currency: 'rub', apiTradeAvailableFlag: true }],
+      });
+
+      await loadCatalog();
+      const instrument = await provider.getInstrumentByTicker('dup');
+
+      expect(instrument).toEqual({ figi: 'SHARE1', ticker: 'DUP', name: 'Share', type: 'STOCK', currency: 'RUB' });
+      expect(findInstrumentCalls('dup')).toBe(0);
+    });
+
+    it('should prefer the API-tradable entry within one source regardless of order', async () => {
+      stubCatalog({
+        'InstrumentsService/Shares': [
+          { ticker: 'AAA', figi: 'AAA-OTC', apiTradeAvailableFlag: false },
+          { ticker: 'AAA', figi: 'AAA-TQBR', apiTradeAvailableFlag: true },
+          { ticker: 'BBB', figi: 'BBB-TQBR', apiTradeAvailableFlag: true },
+          { ticker: 'BBB', figi: 'BBB-OTC', apiTradeAvailableFlag: false },
+        ],
+        'InstrumentsService/Etfs': [],
+        'InstrumentsService/Bonds': [],
+      });
+
+      await loadCatalog();
+
+      expect((await provider.getInstrumentByTicker('AAA'))?.figi).toBe('AAA-TQBR');
+      expect((await provider.getInstrumentByTicker('BBB'))?.figi).toBe('BBB-TQBR');
+    });
+
+    it('should schedule a retry and keep using FindInstrument when a source fails', async () => {
+      stubCatalog({
+        'InstrumentsService/Shares': [{ ticker: 'SBER', figi: 'SHARE-SBER', apiTradeAvailableFlag: true }],
+        'InstrumentsService/Etfs': 503,
+        'InstrumentsService/Bonds': [],
+      });
+
+      const before = Date.now();
+      await loadCatalog();
+      const after = Date.now();
+
+      const refreshAt = (provider as any).catalogRefreshAt as number;
+      expect(refreshAt).toBeGreaterThanOrEqual(before + CATALOG_RETRY_MS);
+      expect(refreshAt).toBeLessThanOrEqual(after + CATALOG_RETRY_MS);
+      expect((provider as any).catalog.size).toBe(0);
+
+      const instrument = await provider.getInstrumentByTicker('SBER');
+      expect(instrument?.figi).toBe('FIND-SBER');
+      expect(findInstrumentCalls('SBER')).toBe(1);
+      expect(callApi).not.toHaveBeenCalledWith('InstrumentsService/Bonds', expect.anything(), expect.anything());
+    });
+  });
+
+  describe('sendRequest', () => {
+    const mockRequest = request as unknown as jest.Mock;
+
+    type Step = { reused: boolean; outcome: 'ok' | 'reset'; beforeReset?: () => void };
+
+    /** Each https.request call plays the next step: a JSON 200 response or ECONNRESET on the socket. */
+    const scriptRequests = (steps: Step[]) => {
+      mockRequest.mockImplementation((_url: string, _options: unknown, callback: (res: any) => void) => {
+        const step = steps.shift();
+        const req: any = new EventEmitter();
+        req.reusedSocket = step?.reused ?? false;
+        req.destroy = jest.fn();
+        req.end = jest.fn(() => {
+          setImmediate(() => {
+            if (step?.outcome === 'ok') {
+              const res: any = new EventEmitter();
+              res.statusCode = 200;
+              res.statusMessage = 'OK';
+              res.headers = {};
+              callback(res);
+              res.emit('data', Buffer.from(JSON.stringify({ user: 'ok' })));
+              res.emit('end');
+              return;
+            }
+            step?.beforeReset?.();
+            req.emit('error', Object.assign(new Error('socket hang up'), { code: 'ECONNRESET' }));
+          });
+        });
+        return req;
+      });
+    };
+
+    const send = (deadline = Date.now() + 10_000) =>
+      (provider as any).sendRequest('UsersService/GetInfo', '{}', deadline, false);
+
+    it('should retry once when a reused socket is reset', async () => {
+      scriptRequests([
+        { reused: true, outcome: 'reset' },
+        { reused: false, outcome: 'ok' },
+      ]);
+
+      await expect(send()).resolves.toEqual({ ok: true, status: 200, statusText: 'OK', data: { user: 'ok' } });
+      expect(mockRequest).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not retry a reset on a fresh socket', async () => {
+      scriptRequests([{ reused: false, outcome: 'reset' }]);
+
+      await expect(send()).rejects.toThrow('socket hang up');
+      expect(mockRequest).toHaveBeenCalledTimes(1);
+    });
+
+    it('should not retry a second time', async () => {
+      scriptRequests([
+        { reused: true, outcome: 'reset' },
+        { reused: true, outcome: 'reset' },
+      ]);
+
+      await expect(send()).rejects.toThrow('socket hang up');
+      expect(mockRequest).toHaveBeenCalledTimes(2);
+    });
+
+    it('should not retry once the deadline has passed', async () => {
+      const now = jest.spyOn(Date, 'now').mockReturnValue(1_000);
+      try {
+        scriptRequests([
+          { reused: true, outcome: 'reset', beforeReset: () => now.mockReturnValue(3_000) },
+          { reused: false, outcome: 'ok' },
+        ]);
+
+        await expect(send(2_000)).rejects.toThrow('socket hang up');
+        expect(mockRequest).toHaveBeenCalledTimes(1);
+      } finally {
+        now.mockRestore();
+      }
+    });
+  });
+});
@@ -1,4 +1,8 @@
-import { Injectable, Logger } from '@nestjs/common';
+import { Injectable, Logger, OnModuleDestroy } from '@nestjs/common';
+import type { IncomingMessage } from 'node:http';
+import { Agent, request } from 'node:https';
+import type { Readable } from 'node:stream';
+import { createBrotliDecompress, createGunzip, createInflate } from 'node:zlib';
 import type { MarketDataProvider, AssetSearchResult } from '../interfaces/market-data-provider.interface';
 import type { InvestmentAssetType } from '@prisma/client';
 import { env } from '../../../config/env.validation';
@@ -9,14 +13,96 @@ import { env } from '../../../config/env.validation';
  */
 const TINKOFF_PRODUCTION_URL = 'https://invest-public-api.tinkoff.ru/rest';
 const TINKOFF_SANDBOX_URL = 'https://sandbox-invest-public-api.tinkoff.ru/rest';
+const TINKOFF_CONTRACT_PREFIX = 'tinkoff.public.invest.api.contract.v1';
+const REQUEST_TIMEOUT_MS = 15_000;
+const TCP_KEEPALIVE_MS = 30_000; // TCP keep-alive пробы на простаивающих сокетах, чтобы NAT не рвал соединение
 const UNAUTHORIZED_WARN_COOLDOWN_MS = 5 * 60 * 1000; // не спамить лог 401 чаще раза в 5 минут
 
+const INSTRUMENT_CACHE_MAX = 4096;
+const MISSING_TICKER_TTL_MS = 5 * 60 * 1000; // «тикер не найден» помним 5 минут
+const CATALOG_TTL_MS = 12 * 60 * 60 * 1000; // полный справочник инструментов обновляем раз в 12 часов
+const CATALOG_RETRY_MS = 5 * 60 * 1000;
+const CATALOG_TIMEOUT_MS = 60_000; // справочник облигаций — несколько мегабайт, обычного дедлайна запроса мало
+/** Порядок важен: при совпадении тикеров приоритет у акций, затем фонды, затем облигации. */
+const CATALOG_SOURCES: Array<{ method: string; type: InvestmentAssetType }> = [
+  { method: 'InstrumentsService/Shares', type: 'STOCK' },
+  { method: 'InstrumentsService/Etfs', type: 'ETF' },
+  { method: 'InstrumentsService/Bonds', type: 'BOND' },
+];
+
+/** InstrumentType enum из ответа FindInstrument (instrumentKind) → наш тип актива. */
+const INSTRUMENT_KIND_TO_ASSET_TYPE: Record<string, InvestmentAssetType> = {
+  INSTRUMENT_TYPE_SHARE: 'STOCK',
+  INSTRUMENT_TYPE_BOND: 'BOND',
+  INSTRUMENT_TYPE_ETF: 'ETF',
+  INSTRUMENT_TYPE_CURRENCY: 'CRYPTO',
+  INSTRUMENT_TYPE_FUTURES: 'OTHER',
+  INSTRUMENT_TYPE_OPTION: 'OTHER',
+  INSTRUMENT_TYPE_SP: 'OTHER',
+  INSTRUMENT_TYPE_CLEARING_CERTIFICATE: 'OTHER',
+  INSTRUMENT_TYPE_INDEX: 'OTHER',
+  INSTRUMENT_TYPE_COMMODITY: 'OTHER',
+};
+
+type TinkoffApiResponse<T> = { ok: boolean; status: number; statusText: string; data: T | null };
+
+type FindInstrumentResponse = {
+  instruments?: Array<{
+    figi?: string;
+    ticker?: string;
+    name?: string;
+    instrumentType?: string;
+    instrumentKind?: string;
+    currency?: string;
+    exchange?: string;
+  }>;
+};
+
+type CatalogResponse = {
+  instruments?: Array<{
+    figi?: string;
+    ticker?: string;
+    name?: string;
+    currency?: string;
+    apiTradeAvailableFlag?: boolean;
+  }>;
+};
+
+type TinkoffInstrument = {
+  figi: string;
+  ticker: string;
+  name: string;
+  type: InvestmentAssetType;
+  currency: string;
+};
+
 @Injectable()
-export class TinkoffMarketDataProvider implements MarketDataProvider {
+export class TinkoffMarketDataProvider implements MarketDataProvider, OnModuleDestroy {
   private readonly logger = new Logger(TinkoffMarketDataProvider.name);
   private readonly apiToken: string;
   private readonly baseUrl: string;
   private readonly isSandbox: boolean;
+  /**
+   * Один keep-alive агент на весь процесс: TCP+TLS рукопожатие не повторяется на каждый вызов API.
+   * Число одновременных соединений не ограничено; между запросами держим тёплыми до TINKOFF_POOL_SIZE
+   * свободных сокетов. lifo — берётся самый недавно использованный сокет: меньше шанс получить соединение,
+   * которое сервер уже закрыл по простою, а лишние сокеты успевают отвалиться.
+   */
+  private readonly agent = new Agent({
+    keepAlive: true,
+    keepAliveMsecs: TCP_KEEPALIVE_MS,
+    maxFreeSockets: env.TINKOFF_POOL_SIZE,
+    scheduling: 'lifo',
+  });
+  private readonly headers: Record<string, string>;
+  /** ticker (upper) → instrument; FIGI/тип инструмента не меняются, кешируем без TTL (LRU по размеру). */
+  private readonly instrumentCache = new Map<string, TinkoffInstrument>();
+  /** ticker (upper) → expiresAt: тикеры, которых нет в Tinkoff, чтобы не повторять FindInstrument. */
+  private readonly missingTickers = new Map<string, number>();
+  /** ticker (upper) → instrument из полного справочника Shares/Etfs/Bonds. */
+  private catalog = new Map<string, TinkoffInstrument>();
+  private catalogRefreshAt = 0;
+  private catalogLoading: Promise<void> | null = null;
   private lastUnauthorizedWarnAt = 0;
 
   constructor() {
@@ -25,6 +111,11 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
     this.isSandbox = !!rawDemo;
     this.apiToken = rawDemo || rawProd;
     this.baseUrl = this.isSandbox ? TINKOFF_SANDBOX_URL : TINKOFF_PRODUCTION_URL;
+    this.headers = {
+      'Content-Type': 'application/json',
+      'Authorization': `Bearer ${this.apiToken}`,
+      'Accept-Encoding': 'gzip, deflate, br',
+    };
     if (!this.apiToken) {
       this.logger.warn('Tinkoff API token not configured. TinkoffMarketDataProvider will not work.');
     } else {
@@ -35,6 +126,104 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
     }
   }
 
+  /**
+   * Начать загрузку справочника заранее, чтобы первые запросы не шли через FindInstrument.
+   * Вызывается из фабрики MarketDataProvider только в HTTP-приложении, где этот провайдер активен.
+   */
+  warmUpCatalog(): void {
+    this.refreshCatalogIfStale();
+  }
+
+  onModuleDestroy() {
+    this.agent.destroy();
+  }
+
+  /**
+   * POST to a Tinkoff REST gateway method (e.g. "MarketDataService/GetLastPrices")
+   * over the shared keep-alive agent. Non-2xx responses resolve with ok=false and no data.
+   * timeoutMs is a total deadline for the call, counted from here (including a retry).
+   */
+  private callApi<T>(method: string, body: unknown, timeoutMs = REQUEST_TIMEOUT_MS): Promise<TinkoffApiResponse<T>> {
+    return this.sendRequest<T>(method, JSON.stringify(body), Date.now() + timeoutMs, false);
+  }
+
+  /**
+   * Single HTTP attempt of callApi. If a reused idle socket turns out to be closed by the server,
+   * the call is retried once on a fresh one within the same deadline.
+   */
+  private sendRequest<T>(
+    method: string,
+    payload: string,
+    deadline: number,
+    retried: boolean,
+  ): Promise<TinkoffApiResponse<T>> {
+    return new Promise((resolve, reject) => {
+      const req = request(
+        `${this.baseUrl}/${TINKOFF_CONTRACT_PREFIX}.${method}`,
+        {
+          method: 'POST',
+          agent: this.agent,
+          headers: { ...this.headers, 'Content-Length': Buffer.byteLength(payload) },
+        },
+        (res) => {
+          const chunks: Buffer[] = [];
+          const fail = (error: Error) => {
+            clearTimeout(timer);
+            reject(error);
+          };
+          const body = this.decodeBody(res);
+          res.on('error', fail);
+          if (body !== res) body.on('error', fail);
+          body.on('data', (chunk: Buffer) => chunks.push(chunk));
+          body.on('end', () => {
+            clearTimeout(timer);
+            const status = res.statusCode ?? 0;
+            const statusText = res.statusMessage ?? '';
+            const ok = status >= 200 && status < 300;
+            if (!ok) {
+              resolve({ ok, status, statusText, data: null });
+              return;
+            }
+            try {
+              resolve({ ok, status, statusText, data: JSON.parse(Buffer.concat(chunks).toString('utf8')) as T });
+            } catch (error) {
+              reject(error);
+            }
+          });
+        },
+      );
+      // Общий дедлайн с момента вызова: таймаут сокета не тикает, пока запрос ждёт свободный сокет
+      const timer = setTimeout(
+        () => req.destroy(new Error(`Tinkoff API timeout (${method})`)),
+        Math.max(0, deadline - Date.now()),
+      );
+      req.on('error', (error: NodeJS.ErrnoException) => {
+        clearTimeout(timer);
+        // Все методы, которые мы вызываем, — чтение, повтор безопасен
+        if (!retried && req.reusedSocket && error.code === 'ECONNRESET' && Date.now() < deadline) {
+          resolve(this.sendRequest<T>(method, payload, deadline, true));
+          return;
+        }
+        reject(error);
+      });
+      req.end(payload);
+    });
+  }
+
+  /** Тело ответа с учётом Content-Encoding (справочники инструментов сжимаются в разы). */
+  private decodeBody(res: IncomingMessage): Readable {
+    switch (res.headers['content-encoding']) {
+      case 'gzip':
+        return res.pipe(createGunzip());
+      case 'deflate':
+        return res.pipe(createInflate());
+      case 'br':
+        return res.pipe(createBrotliDecompress());
+      default:
+        return res;
+    }
+  }
+
   /** Логировать 401 не чаще раза в 5 минут, чтобы не забивать логи. */
   private warnOnce401(context: string): void {
     const now = Date.now();
@@ -51,9 +240,8 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
    */
   private quotationToNumber(quotation: { units?: string | number; nano?: number } | null | undefined): number {
     if (!quotation) return 0;
-    const units = typeof quotation.units === 'string' ? parseFloat(quotation.units) : (quotation.units || 0);
-    const nano = quotation.nano || 0;
-    return units + nano / 1_000_000_000;
+    // REST-шлюз отдаёт int64 units строкой; Number() принимает и строку, и число без отдельной ветки
+    return Number(quotation.units ?? 0) + (quotation.nano ?? 0) / 1_000_000_000;
   }
 
   /**
@@ -76,24 +264,17 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
 
       // Get last price using Tinkoff InvestAPI REST endpoint
       // Note: Tinkoff InvestAPI is primarily gRPC-based, but we use REST wrapper
-      const response = await fetch(`${this.baseUrl}/tinkoff.public.invest.api.contract.v1.MarketDataService/GetLastPrices`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${this.apiToken}`,
-        },
-        body: JSON.stringify({
-          figi: [instrument.figi],
-        }),
-      });
+      const response = await this.callApi<{ lastPrices?: Array<{ price?: { units?: string | number; nano?: number } }> }>(
+        'MarketDataService/GetLastPrices',
+        { figi: [instrument.figi] },
+      );
 
       if (!response.ok) {
-        this.logger.warn(`Tinkoff API error: ${response.status} ${response.statusText}`);
+        this.logger.warn(`Tinkoff API error (GetLastPrices): ${response.status} ${response.statusText}`);
         return null;
       }
 
-      const data = await response.json() as { lastPrices?: Array<{ price?: { units?: string | number; nano?: number } }> };
-      const lastPrice = data.lastPrices?.[0];
+      const lastPrice = response.data?.lastPrices?.[0];
       if (!lastPrice) {
         return null;
       }
@@ -117,26 +298,51 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
       return result;
     }
 
-    // Process in batches to avoid rate limits
-    const batchSize = 10;
-    for (let i = 0; i < symbols.length; i += batchSize) {
-      const batch = symbols.slice(i, i + batchSize);
-      const promises = batch.map(async ({ symbol }) => {
-        try {
-          const price = await this.getCurrentPrice(symbol);
-          if (price !== null) {
-            result.set(symbol.toUpperCase(), price);
-          }
-        } catch (error) {
-          this.logger.debug(`Failed to get price for ${symbol}:`, error);
+    // 1) Resolve FIGIs. Не больше TINKOFF_POOL_SIZE резолвов одновременно (по числу тёплых сокетов);
+    // воркер берёт следующий тикер сразу, как только освободится.
+    const symbolsByFigi = new Map<string, string[]>();
+    const queue = [...symbols];
+    const workers = Array.from({ length: Math.min(env.TINKOFF_POOL_SIZE, queue.length) }).map(async () => {
+      while (queue.length) {
+        const item = queue.shift();
+        if (!item) break;
+        // findInstrumentByTicker не бросает: ошибки API/сети уже залогированы и дают null
+        const instrument = await this.findInstrumentByTicker(item.symbol);
+        if (instrument) {
+          const list = symbolsByFigi.get(instrument.figi) ?? [];
+          list.push(item.symbol.toUpperCase());
+          symbolsByFigi.set(instrument.figi, list);
         }
-      });
+      }
+    });
+    await Promise.all(workers);
+
+    if (symbolsByFigi.size === 0) {
+      return result;
+    }
+
+    // 2) Цены всех найденных FIGI — одним запросом GetLastPrices
+    try {
+      const response = await this.callApi<{ lastPrices?: Array<{ figi?: string; price?: { units?: string | number; nano?: number } }> }>(
+        'MarketDataService/GetLastPrices',
+        { figi: [...symbolsByFigi.keys()] },
+      );
 
-      await Promise.all(promises);
-      // Small delay to avoid rate limits
-      if (i + batchSize < symbols.length) {
-        await new Promise(resolve => setTimeout(resolve, 100));
+      if (!response.ok) {
+        if (response.status === 401) this.warnOnce401('GetLastPrices');
+        else this.logger.warn(`Tinkoff API error (GetLastPrices, batch): ${response.status} ${response.statusText}`);
+        return result;
+      }
+
+      for (const lastPrice of response.data?.lastPrices || []) {
+        if (!lastPrice.figi || !lastPrice.price) continue;
+        const price = this.quotationToNumber(lastPrice.price);
+        for (const symbol of symbolsByFigi.get(lastPrice.figi) ?? []) {
+          result.set(symbol, price);
+        }
       }
+    } catch (error) {
+      this.logger.error(`Error fetching batch prices:`, error);
     }
 
     return result;
@@ -159,29 +365,19 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
       if (!q) return [];
 
       // Search instruments
-      const response = await fetch(`${this.baseUrl}/tinkoff.public.invest.api.contract.v1.InstrumentsService/FindInstrument`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${this.apiToken}`,
-        },
-        body: JSON.stringify({
-          query: q,
-        }),
-      });
+      const response = await this.callApi<FindInstrumentResponse>('InstrumentsService/FindInstrument', { query: q });
 
       if (!response.ok) {
         if (response.status === 401) this.warnOnce401('search');
         return [];
       }
 
-      const data = await response.json() as { instruments?: Array<{ ticker?: string; name?: string; instrumentType?: string; currency?: string; exchange?: string }> };
-      const instruments = data.instruments || [];
+      const instruments = response.data?.instruments || [];
 
       const results = instruments
         .slice(0, 20)
         .map((inst) => {
-          const type = this.mapInstrumentType(inst.instrumentType);
+          const type = this.mapInstrumentType(inst.instrumentType, inst.instrumentKind);
           if (assetType && type !== assetType) {
             return null;
           }
@@ -207,39 +403,64 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
   }
 
   /**
-   * Find instrument by ticker (internal helper)
+   * Find instrument by exact ticker (internal helper).
+   * One FindInstrument call returns FIGI, name and type together; results are cached per ticker.
    */
-  private async findInstrumentByTicker(ticker: string): Promise<{ figi: string; ticker: string } | null> {
+  private async findInstrumentByTicker(ticker: string): Promise<TinkoffInstrument | null> {
+    const key = ticker.trim().toUpperCase();
+    this.refreshCatalogIfStale();
+    const fromCatalog = this.catalog.get(key);
+    if (fromCatalog) {
+      return fromCatalog;
+    }
+
+    const cached = this.instrumentCache.get(key);
+    if (cached) {
+      // LRU: перемещаем в конец Map
+      this.instrumentCache.delete(key);
+      this.instrumentCache.set(key, cached);
+      return cached;
+    }
+
+    const missingUntil = this.missingTickers.get(key);
+    if (missingUntil !== undefined) {
+      if (Date.now() < missingUntil) return null;
+      this.missingTickers.delete(key);
+    }
+
     try {
-      const response = await fetch(`${this.baseUrl}/tinkoff.public.invest.api.contract.v1.InstrumentsService/FindInstrument`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${this.apiToken}`,
-        },
-        body: JSON.stringify({
-          query: ticker,
-        }),
-      });
+      const response = await this.callApi<FindInstrumentResponse>('InstrumentsService/FindInstrument', { query: ticker });
 
       if (!response.ok) {
         if (response.status === 401) this.warnOnce401('FindInstrument');
         return null;
       }
 
-      const data = await response.json() as { instruments?: Array<{ ticker?: string; figi?: string }> };
-      const instruments = data.instruments || [];
-      const match = instruments.find((inst) => 
-        inst.ticker?.toUpperCase() === ticker.toUpperCase()
-      );
+      const instruments = response.data?.instruments || [];
+      const match = instruments.find((inst) => inst.ticker?.toUpperCase() === key);
 
       if (match && match.figi && match.ticker) {
-        return {
+        const instrument: TinkoffInstrument = {
           figi: match.figi,
           ticker: match.ticker,
+          name: match.name || match.ticker,
+          type: this.mapInstrumentType(match.instrumentType, match.instrumentKind),
+          currency: this.normalizeCurrency(match.currency),
         };
+        this.instrumentCache.set(key, instrument);
+        if (this.instrumentCache.size > INSTRUMENT_CACHE_MAX) {
+          const oldest = this.instrumentCache.keys().next().value;
+          if (oldest !== undefined) this.instrumentCache.delete(oldest);
+        }
+        return instrument;
       }
 
+      // Кешируем только подтверждённый ответом API промах (не 401/5xx/сетевые ошибки)
+      this.missingTickers.set(key, Date.now() + MISSING_TICKER_TTL_MS);
+      if (this.missingTickers.size > INSTRUMENT_CACHE_MAX) {
+        const oldest = this.missingTickers.keys().next().value;
+        if (oldest !== undefined) this.missingTickers.delete(oldest);
+      }
       return null;
     } catch (error) {
       this.logger.error(`Error finding instrument:`, error);
@@ -247,10 +468,79 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
     }
   }
 
+  /** API отдаёт валюту в нижнем регистре ("rub"); к клиенту всегда уходит код в верхнем. */
+  private normalizeCurrency(currency?: string): string {
+    return (currency || 'RUB').toUpperCase();
+  }
+
+  /**
+   * Start a background (re)load of the instruments catalog when it is stale.
+   * Lookups never wait for it: until the catalog is ready they go through FindInstrument.
+   */
+  private refreshCatalogIfStale(): void {
+    if (!this.apiToken || this.catalogLoading || Date.now() < this.catalogRefreshAt) return;
+    this.catalogLoading = this.loadCatalog()
+      .then(() => {
+        this.catalogRefreshAt = Date.now() + CATALOG_TTL_MS;
+      })
+      .catch((error) => {
+        this.catalogRefreshAt = Date.now() + CATALOG_RETRY_MS;
+        this.logger.warn(`Tinkoff catalog load failed: ${error instanceof Error ? error.message : String(error)}`);
+      })
+      .finally(() => {
+        this.catalogLoading = null;
+      });
+  }
+
+  /**
+   * Download Shares, Etfs and Bonds and index them by ticker.
+   * Sources are fetched one at a time so catalog downloads hold at most one socket next to live traffic.
+   */
+  private async loadCatalog(): Promise<void> {
+    const next = new Map<string, TinkoffInstrument>();
+    for (const { method, type } of CATALOG_SOURCES) {
+      const response = await this.callApi<CatalogResponse>(
+        method,
+        { instrumentStatus: 'INSTRUMENT_STATUS_BASE' },
+        CATALOG_TIMEOUT_MS,
+      );
+      if (!response.ok) {
+        if (response.status === 401) this.warnOnce401(method);
+        throw new Error(`${method} returned ${response.status}`);
+      }
+      // Внутри одного справочника тикер может торговаться в нескольких режимах — берём доступный через API
+      const fromSource = new Map<string, TinkoffInstrument>();
+      const tradable = new Set<string>();
+      for (const inst of response.data?.instruments || []) {
+        if (!inst.figi || !inst.ticker) continue;
+        const key = inst.ticker.toUpperCase();
+        if (fromSource.has(key) && (tradable.has(key) || !inst.apiTradeAvailableFlag)) continue;
+        fromSource.set(key, {
+          figi: inst.figi,
+          ticker: inst.ticker,
+          name: inst.name || inst.ticker,
+          type,
+          currency: this.normalizeCurrency(inst.currency),
+        });
+        if (inst.apiTradeAvailableFlag) tradable.add(key);
+      }
+      // Между справочниками приоритет по порядку CATALOG_SOURCES: ранее добавленный тикер не перезаписываем
+      for (const [key, instrument] of fromSource) {
+        if (!next.has(key)) next.set(key, instrument);
+      }
+    }
+
+    this.catalog = next;
+    this.logger.log(`Tinkoff instruments catalog loaded: ${next.size} tickers`);
+  }
+
   /**
-   * Map Tinkoff instrument type to our AssetType
+   * Map Tinkoff instrument type to our AssetType.
+   * Prefers the typed instrumentKind enum; falls back to matching the free-form instrumentType string.
    */
-  private mapInstrumentType(tinkoffType?: string): InvestmentAssetType {
+  private mapInstrumentType(tinkoffType?: string, instrumentKind?: string): InvestmentAssetType {
+    const byKind = instrumentKind ? INSTRUMENT_KIND_TO_ASSET_TYPE[instrumentKind] : undefined;
+    if (byKind) return byKind;
     const upper = tinkoffType?.toUpperCase() || '';
     if (upper.includes('SHARE') || upper === 'STOCK') return 'STOCK';
     if (upper.includes('BOND')) return 'BOND';
@@ -286,34 +576,26 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
     }
 
     try {
-      const response = await fetch(`${this.baseUrl}/tinkoff.public.invest.api.contract.v1.MarketDataService/GetCandles`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-          'Authorization': `Bearer ${this.apiToken}`,
-        },
-        body: JSON.stringify({
-          figi,
-          from: from.toISOString(),
-          to: to.toISOString(),
-          interval: `CANDLE_INTERVAL_${interval}`,
-        }),
-      });
-
-      if (!response.ok) {
-        this.logger.warn(`Tinkoff candles error: ${response.status}`);
-        return [];
-      }
-
-      const data = await response.json() as { candles?: Array<{
+      const response = await this.callApi<{ candles?: Array<{
         time?: string;
         open?: { units?: string | number; nano?: number };
         high?: { units?: string | number; nano?: number };
         low?: { units?: string | number; nano?: number };
         close?: { units?: string | number; nano?: number };
         volume?: number;
-      }> };
-      const candles = data.candles || [];
+      }> }>('MarketDataService/GetCandles', {
+        figi,
+        from: from.toISOString(),
+        to: to.toISOString(),
+        interval: `CANDLE_INTERVAL_${interval}`,
+      });
+
+      if (!response.ok) {
+        this.logger.warn(`Tinkoff candles error: ${response.status} ${response.statusText}`);
+        return [];
+      }
+
+      const candles = response.data?.candles || [];
 
       return candles.map((candle) => ({
         time: candle.time || new Date().toISOString(),
@@ -343,53 +625,29 @@ export class TinkoffMarketDataProvider implements MarketDataProvider {
       return null;
     }
 
-    try {
-      // First try to find by ticker directly
-      const figiResponse = await this.findInstrumentByTicker(ticker);
-      if (figiResponse) {
-        // Get full instrument info
-        const instruments = await this.searchAssets(ticker);
-        const match = instruments.find(inst => inst.symbol.toUpperCase() === ticker.toUpperCase());
-        
-        if (match) {
-          const validType: InvestmentAssetType = match.type === 'FUTURES' ? 'OTHER' : match.type;
-          return {
-            figi: figiResponse.figi,
-            ticker: match.symbol,
-            name: match.name,
-            type: validType,
-            currency: match.currency,
-          };
-        }
-      }
+    // findInstrumentByTicker и searchAssets не бросают: ошибки API/сети логируются и дают null/[]
+    // First try to find by ticker directly (catalog or cached single FindInstrument call)
+    const exact = await this.findInstrumentByTicker(ticker);
+    if (exact) {
+      return exact;
+    }
 
-      // If direct search failed, try broader search
-      const instruments = await this.searchAssets(ticker);
-      const match = instruments.find(inst => 
-        inst.symbol.toUpperCase() === ticker.toUpperCase() ||
-        inst.symbol.toUpperCase().startsWith(ticker.toUpperCase())
-      );
-      
-      if (match) {
-        // Try to get FIGI for matched instrument
-        const figiResponse = await this.findInstrumentByTicker(match.symbol);
-        if (figiResponse) {
-          const validType: InvestmentAssetType = match.type === 'FUTURES' ? 'OTHER' : match.type;
-          return {
-            figi: figiResponse.figi,
-            ticker: match.symbol,
-            name: match.name,
-            type: validType,
-            currency: match.currency,
-          };
-        }
+    // If direct search failed, try broader search
+    const instruments = await this.searchAssets(ticker);
+    const match = instruments.find(inst => 
+      inst.symbol.toUpperCase() === ticker.toUpperCase() ||
+      inst.symbol.toUpperCase().startsWith(ticker.toUpperCase())
+    );
+    
+    if (match) {
+      // Try to get FIGI for matched instrument
+      const instrument = await this.findInstrumentByTicker(match.symbol);
+      if (instrument) {
+        return instrument;
       }
-
-      this.logger.warn(`Instrument not found for ticker: ${ticker}`);
-      return null;
-    } catch (error) {
-      this.logger.error(`Error getting instrument for ${ticker}:`, error);
-      return null;
     }
+
+    this.logger.warn(`Instrument not found for ticker: ${ticker}`);
+    return null;
   }
 }